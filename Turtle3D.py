@@ -1,31 +1,209 @@
 """Module that renders and manages 3D objects in Turtle, with lighting, cameras, and more."""
 
-import turtle, math, copy, numpy
+import turtle
+from math import radians, sin, cos, tan, sqrt
+import numpy as np
+
+try:
+    # Optional, compiles the face lighting kernel to native code when installed (the NumPy version is used otherwise)
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+def _jit(function):
+    """
+    Decorator which compiles a numeric kernel with Numba when it is installed. Without Numba the function is returned uncompiled, and callers use a NumPy version of the kernel instead.
+    """
+    if njit is None: return function
+    return njit(cache=True, fastmath=True, parallel=True)(function)
 
 def load_obj_file(filename):
     """
-    Load vertices and faces from an .obj file.
+    Load vertices and faces from an .obj file. The file is read twice, once to count vertices and triangles, and once to fill preallocated storage. Faces with more than three vertices (n-gons) are fan triangulated on load.
 
     Returns:
-    - verts (list): 2D list containing [x,y,z] coordinates of every vertex as floats or integers.
-    - faces (list): 2D list containing the indexes of vertices to join to make faces.
+    - verts (numpy.ndarray): Nx3 float32 array containing [x,y,z] coordinates of every vertex.
+    - faces (numpy.ndarray): Fx3 int32 array containing the indexes of the three vertices of every triangle (starts at 1 by .obj convention).
     """
-    verts = []
-    faces = []
-    file = open(filename, 'r')
-    lines = file.readlines()
-    for line in lines:
-        if line.startswith("v "):
-            raw = line.replace("\n", "").replace("v ","").split(" ")
-            for x in range(len(raw)): raw[x] = float(raw[x])
-            verts.append(raw)
-        elif line.startswith("f "):
-            raw = line.replace("\n", "").replace("f ","").split(" ")
-            for x in range(len(raw)): raw[x] = int(raw[x])
-            faces.append(raw)
-    file.close()
+    with open(filename, 'r') as file:
+        vertex_count = triangle_count = 0
+        for line in file:
+            if line.startswith("v "): vertex_count += 1
+            elif line.startswith("f "): triangle_count += max(len(line.split()) - 3, 0)
+
+        verts = np.empty((vertex_count, 3), dtype=np.float32)
+        faces = np.empty((triangle_count, 3), dtype=np.int32)
+        vertex_index = triangle_index = 0
+
+        file.seek(0)
+        for line in file:
+            if line.startswith("v "):
+                verts[vertex_index] = np.fromstring(line[2:], dtype=np.float32, sep=" ")[:3]
+                vertex_index += 1
+            elif line.startswith("f "):
+                face = [int(index.split("/")[0]) for index in line.split()[1:]]
+                if len(face) < 3: continue
+                end = triangle_index + len(face) - 2
+                # Fan around the first vertex: (0, 1, 2), (0, 2, 3), ...
+                faces[triangle_index:end, 0] = face[0]
+                faces[triangle_index:end, 1] = face[1:-1]
+                faces[triangle_index:end, 2] = face[2:]
+                triangle_index = end
     return verts, faces
 
+def triangulate_face_array(face_array: list):
+    """
+    Fan triangulate a 2D list of faces into triangles, in the same format as load_obj_file.
+
+    Parameters:
+    - face_array (list): 2D list containing the indexes of vertices to join to make faces.
+
+    Returns:
+    - faces (numpy.ndarray): Fx3 int32 array containing the indexes of the three vertices of every triangle.
+    """
+    return np.array([(face[0], face[i], face[i + 1]) for face in face_array for i in range(1, len(face) - 1)], dtype=np.int32).reshape(-1, 3)
+
+def build_rotation_matrix(rotation: list, rotation_order: list = None):
+    """
+    Build a 3x3 matrix which rotates vertices on each axis in turn, using the same rotation convention as objects.
+
+    Parameters:
+    - rotation (list): A list of three floats or integers representing the degrees to turn around the x, y, and z axis.
+    - rotation_order (list): The order in which rotations are applied - Defaults to ['x','y','z'].
+
+    Returns:
+    - rotation_matrix (numpy.ndarray): 3x3 float32 matrix applying every rotation to a column vector.
+    """
+    if rotation_order is None:
+        rotation_order = ['x','y','z']
+    axis_planes = {'x': (0, 1, 2), 'y': (1, 0, 2), 'z': (2, 0, 1)}
+
+    # Each axis rotation only mixes two rows of the accumulated matrix, so rows are updated in place rather than multiplying full 3x3 matrices
+    rows = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    for step in rotation_order:
+        if step not in axis_planes: continue
+        axis, a, b = axis_planes[step]
+        angle = radians(rotation[axis])
+        sinTheata = sin(angle)
+        cosTheata = cos(angle)
+
+        row_a, row_b = rows[a], rows[b]
+        rows[a] = [cosTheata * row_a[i] + sinTheata * row_b[i] for i in range(3)]
+        rows[b] = [cosTheata * row_b[i] - sinTheata * row_a[i] for i in range(3)]
+    return np.array(rows, dtype=np.float32)
+
+@_jit
+def _light_faces_batched(anchors, normals, camera_position, light_positions, light_colors, light_intensities, base_color, diffuse_color, specular_color, specular_coefficient):
+    """
+    Calculate the colour of every face from its anchor vertex and unit normal, with ambient, diffuse and specular lighting.
+
+    Parameters:
+    - anchors (numpy.ndarray): Fx3 array with a world-space vertex of each face.
+    - normals (numpy.ndarray): Fx3 array of world-space unit face normals.
+    - camera_position (numpy.ndarray): The x, y, z coordinates of the camera.
+    - light_positions (numpy.ndarray): Lx3 array of light positions.
+    - light_colors (numpy.ndarray): Lx3 array of light colours, scaled to 0.0 - 1.0.
+    - light_intensities (numpy.ndarray): Array of L light intensities.
+    - base_color (numpy.ndarray): The ambient colour of the material already lit by the ambient light.
+    - diffuse_color (numpy.ndarray): The diffuse colour of the material.
+    - specular_color (numpy.ndarray): The specular colour of the material.
+    - specular_coefficient (float): The shininess coefficient of the material.
+
+    Returns:
+    - colors (numpy.ndarray): Fx3 array of RGB colours, capped at 255.
+    """
+    colors = np.empty((anchors.shape[0], 3))
+
+    for i in prange(anchors.shape[0]):
+        nx, ny, nz = normals[i, 0], normals[i, 1], normals[i, 2]
+
+        vx = camera_position[0] - anchors[i, 0]
+        vy = camera_position[1] - anchors[i, 1]
+        vz = camera_position[2] - anchors[i, 2]
+        length = sqrt(vx * vx + vy * vy + vz * vz)
+        inverse = 1 / length if length >= 1e-6 else 0.0
+        vx, vy, vz = vx * inverse, vy * inverse, vz * inverse
+        normal_dot_view = nx * vx + ny * vy + nz * vz
+
+        r, g, b = base_color[0], base_color[1], base_color[2]
+
+        for j in range(light_positions.shape[0]):
+            lx = light_positions[j, 0] - anchors[i, 0]
+            ly = light_positions[j, 1] - anchors[i, 1]
+            lz = light_positions[j, 2] - anchors[i, 2]
+            light_distance = sqrt(lx * lx + ly * ly + lz * lz)
+            inverse = 1 / light_distance if light_distance >= 1e-6 else 0.0
+            lx, ly, lz = lx * inverse, ly * inverse, lz * inverse
+
+            dot_product = max(nx * lx + ny * ly + nz * lz, 0.0)
+            diffuse_intensity = dot_product * light_intensities[j]
+
+            # The reflection 2 * dot * N - L of unit vectors is already unit length, so its dot with the view direction is expanded instead of building and normalizing it
+            spec_angle = max(2 * dot_product * normal_dot_view - (lx * vx + ly * vy + lz * vz), 0.0)
+            spec_intensity = spec_angle ** specular_coefficient / (light_distance + 1)
+
+            red, green, blue = light_colors[j, 0], light_colors[j, 1], light_colors[j, 2]
+            r = min(255.0, r + diffuse_intensity * diffuse_color[0] * red + spec_intensity * specular_color[0] * red)
+            g = min(255.0, g + diffuse_intensity * diffuse_color[1] * green + spec_intensity * specular_color[1] * green)
+            b = min(255.0, b + diffuse_intensity * diffuse_color[2] * blue + spec_intensity * specular_color[2] * blue)
+
+        colors[i, 0] = r
+        colors[i, 1] = g
+        colors[i, 2] = b
+
+    return colors
+
+def _normalize_rows(vectors):
+    """
+    Normalize each row of an Nx3 array, with near zero rows becoming zero.
+
+    Parameters:
+    - vectors (numpy.ndarray): Nx3 array of vectors.
+
+    Returns:
+    - normalized_vectors (numpy.ndarray): Nx3 array of unit (or zero) vectors.
+    """
+    lengths = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))[:, None]
+    lengths[lengths < 1e-6] = np.inf
+    return vectors / lengths
+
+def _light_faces_vectorized(anchors, normals, camera_position, light_positions, light_colors, light_intensities, base_color, diffuse_color, specular_color, specular_coefficient):
+    """
+    NumPy equivalent of _light_faces_batched, lighting every face at once with one pass per light instead of a Python loop over faces.
+
+    Parameters:
+    - See _light_faces_batched.
+
+    Returns:
+    - colors (numpy.ndarray): Fx3 array of RGB colours, capped at 255.
+    """
+    colors = np.empty((len(anchors), 3))
+    colors[:] = base_color
+
+    view_dirs = _normalize_rows(camera_position - anchors)
+    normal_dot_view = np.einsum('ij,ij->i', normals, view_dirs)
+
+    for light_position, light_color, light_intensity in zip(light_positions, light_colors, light_intensities):
+        light_dirs = light_position - anchors
+        light_distances = np.sqrt(np.einsum('ij,ij->i', light_dirs, light_dirs))
+        light_dirs /= np.where(light_distances < 1e-6, np.inf, light_distances)[:, None] # Normalized with the distances already taken
+
+        dot_products = np.maximum(np.einsum('ij,ij->i', normals, light_dirs), 0)
+        colors += (dot_products[:, None] * light_intensity) * (diffuse_color * light_color)
+
+        # The reflection 2 * dot * N - L of unit vectors is already unit length, so its dot with the view direction is expanded instead of building and normalizing it
+        spec_angles = np.maximum(2 * dot_products * normal_dot_view - np.einsum('ij,ij->i', light_dirs, view_dirs), 0)
+        spec_intensities = (spec_angles ** specular_coefficient / (light_distances + 1))[:, None]
+        colors += spec_intensities * (specular_color * light_color)
+
+        np.minimum(colors, 255, out=colors)
+
+    return colors
+
+_light_faces = _light_faces_batched if njit is not None else _light_faces_vectorized
+"""Face lighting kernel used by objects, compiled loop with Numba or vectorized NumPy without it."""
+
 class Turtle3DError(Exception):
     """
     A custom exception class for Turtle3D specific errors.
@@ -111,14 +289,20 @@ class Window:
         self.screen.tracer(0,0)
         self.screen.setup(width=width, height=height)
         self.canvas = self.screen.getcanvas()
+        self._width = self.screen.window_width() # Kept up to date by _track_resize rather than queried from Tk every render
+        self._height = self.screen.window_height()
         self._is_full_screen = False
         if fullscreen: self.toggle_full_screen()
         self.pointer = turtle.Turtle()
         self.pointer.hideturtle()
         self._mouse_x = 0
         self._mouse_y = 0
+        self._polygon_items = [] # Canvas polygons reused across frames
+        self._line_items = [] # Canvas lines reused across frames
+        self._background_color = None # Last colour passed to _set_background_color
         self.screen.title(title)
         self.canvas.bind('<Motion>', self._track_mouse_motion)
+        self.canvas.bind('<Configure>', self._track_resize, add='+')
         self.screen.listen()
 
     def toggle_full_screen(self):
@@ -135,6 +319,55 @@ class Window:
         self.canvas.destroy()
         turtle.bye()
             
+    def _set_background_color(self, color: tuple):
+        """
+        Internal function to set the background colour, only calling into Tk when it changes rather than querying it every frame.
+
+        Parameters:
+        - color (tuple): An RGB tuple containing the background colour.
+        """
+        color = tuple(color) # Copied so later changes to a list are still noticed
+        if color != self._background_color:
+            self.screen.bgcolor(color)
+            self._background_color = color
+
+    def _draw_polygons(self, polygons: list):
+        """
+        Internal function to draw filled polygons directly on the canvas, in order.
+
+        Parameters:
+        - polygons (list): A list of (coords, fill) tuples, where coords is a flat list of canvas coordinates and fill is a Tk colour string.
+        """
+        self._draw_pooled_items(self._polygon_items, polygons, lambda coords, fill: self.canvas.create_polygon(coords, fill=fill, outline=''))
+
+    def _draw_lines(self, lines: list):
+        """
+        Internal function to draw lines directly on the canvas, in order.
+
+        Parameters:
+        - lines (list): A list of (coords, fill) tuples, where coords is a flat list of canvas coordinates and fill is a Tk colour string.
+        """
+        self._draw_pooled_items(self._line_items, lines, lambda coords, fill: self.canvas.create_line(coords, fill=fill, width=1))
+
+    def _draw_pooled_items(self, pool: list, items: list, create_item):
+        """
+        Internal function to draw canvas items in order. Canvas items from previous frames are reused (moved and recoloured) instead of being recreated, and any left over are hidden.
+
+        Parameters:
+        - pool (list): Canvas item ids kept between frames, extended when more items are needed.
+        - items (list): A list of (coords, fill) tuples to draw.
+        - create_item (function): Creates a new canvas item from coords and fill, returning its id.
+        """
+        for index, (coords, fill) in enumerate(items):
+            if index < len(pool):
+                item = pool[index]
+                self.canvas.coords(item, coords)
+                self.canvas.itemconfigure(item, fill=fill, state='normal')
+            else:
+                pool.append(create_item(coords, fill))
+        for item in pool[len(items):]:
+            self.canvas.itemconfigure(item, state='hidden')
+
     def _track_mouse_motion(self, event):
         """
         Internal function to track mouse motion. Bound to the canvas with a motion sequence.
@@ -142,11 +375,22 @@ class Window:
         Parameters:
         - event (tkinter.Event): Tkinter event to recieve motion information from.
         """
-        half_width = self.screen.window_width() // 2
-        half_height = self.screen.window_height() // 2
+        half_width = self._width // 2
+        half_height = self._height // 2
         self._mouse_x = event.x - half_width
         self._mouse_y = half_height - event.y
 
+    def _track_resize(self, event):
+        """
+        Internal function to track the window size. Bound to the canvas with a configure sequence.
+
+        Parameters:
+        - event (tkinter.Event): Tkinter event to recieve the new size from.
+        """
+        if event.width > 1 and event.height > 1: # Not yet mapped
+            self._width = event.width
+            self._height = event.height
+
 global_window = Window()
 """Window instance used by all render functions."""
 
@@ -161,11 +405,13 @@ class Material:
         - diffuse_color (tuple): The diffuse RGB color as a tuple (R, G, B) - Defaults to white.
         - specular_color (tuple): The specular RGB color as a tuple (R, G, B) - Defaults to white.
         - specular_coefficient (float): The shininess coefficient of the material - Defaults to 10.0.
+
+        Colors are stored as packed uint8 arrays, and only converted for arithmetic when shading.
         """
         self.name = name
-        self.ambient_color = ambient_color if ambient_color is not None else (255, 255, 255)
-        self.diffuse_color = diffuse_color if diffuse_color is not None else (255, 255, 255)
-        self.specular_color = specular_color if specular_color is not None else (255, 255, 255)
+        self.ambient_color = np.asarray(ambient_color if ambient_color is not None else (255, 255, 255), dtype=np.uint8)
+        self.diffuse_color = np.asarray(diffuse_color if diffuse_color is not None else (255, 255, 255), dtype=np.uint8)
+        self.specular_color = np.asarray(specular_color if specular_color is not None else (255, 255, 255), dtype=np.uint8)
         self.specular_coefficient = specular_coefficient if specular_coefficient else 10.0
     
     def get_rgb_tuple(self):
@@ -175,7 +421,7 @@ class Material:
         Returns:
         diffuse_color (tuple) - The diffuse colour of the material.
         """
-        return self.diffuse_color
+        return tuple(self.diffuse_color.tolist())
     
 class Light:
     """
@@ -184,26 +430,26 @@ class Light:
     Parameters:
     - name (str): Name of the light, must be unique in the global memory.    
     - position (list): A list of three floats or integers representing the light's position on the x, y, and z axis.
-    - color (tuple): A tuple representing RGB color values that the light emits - Defaults to (255,255,255).
+    - color (tuple): A tuple representing RGB color values that the light emits, stored as a uint8 array - Defaults to (255,255,255).
     - intesity (float): A float from 0.0 to 1.0 representing the intensity of the light - Defaults to 1.0.
     """
-    _global_light_memory = []
+    _global_light_memory = {} # Keyed by name
     _next_memory_id = 1
 
     def __init__(self, name: str, position: list, color : tuple = None, intensity: float = None):
         
-        if any(light._name == name for light in self._global_light_memory):
-            raise DuplicateNameError()
+        if name in self._global_light_memory:
+            raise DuplicateNameError(name)
         
         self._name = name
         self.position = position
-        self.color = color if color else (255,255,255)
+        self.color = np.asarray(color if color else (255,255,255), dtype=np.uint8)
         self.intensity = intensity if intensity else 1.0
 
         self._scenes = []
         self._id = self._next_memory_id
-        self._global_light_memory.append(self)
-        self._next_memory_id += 1
+        self._global_light_memory[name] = self
+        Light._next_memory_id += 1
 
     def add_to_scene(self, scene: 'Scene'):
         """
@@ -233,8 +479,11 @@ class Light:
         Parameters:
         - new_name (str): New name assigned to the light, must be unique among all scenes.
         """
-        if any(obj._name == new_name for obj in self._global_light_memory):
-            raise DuplicateNameError()
+        if new_name in self._global_light_memory:
+            raise DuplicateNameError(new_name)
+        self._global_light_memory[new_name] = self._global_light_memory.pop(self._name)
+        for scene in self._scenes:
+            scene._light_name_index[new_name] = scene._light_name_index.pop(self._name)
         self._name = new_name
     
 
@@ -246,12 +495,12 @@ class Scene:
     - name (str): Name assigned to the scene, must be unique among all scenes.
     - ambient_light (tuple): Ambient light/background for scene (R,G,B) - Defaults to (25,25,25).
     """
-    _global_scene_memory = []
+    _global_scene_memory = {} # Keyed by name
     _next_memory_id = 1
 
     def __init__(self, name: str, ambient_light: tuple = None):
-        if any(scene._name == name for scene in self._global_scene_memory):
-            raise DuplicateNameError()
+        if name in self._global_scene_memory:
+            raise DuplicateNameError(name)
         
         if ambient_light is None:
             ambient_light = (25,25,25)
@@ -260,11 +509,15 @@ class Scene:
         self._name = name
         self._object_memory = []
         self._light_memory = []
+        self._object_name_index = {}
+        self._light_name_index = {}
+        self._object_by_id = {}
+        self._light_by_id = {}
         self._active_camera = None
         
         self._id = self._next_memory_id
-        self._next_memory_id += 1
-        self._global_scene_memory.append(self)
+        Scene._next_memory_id += 1
+        self._global_scene_memory[name] = self
 
     def add_object(self, object: 'Object'):
         """
@@ -273,9 +526,11 @@ class Scene:
         Parameters:
         - object (Object): Reference to the object to be added.
         """
-        if any(obj._name == object._name for obj in self._object_memory):
-            raise AlreadyInSceneError()
+        if object._name in self._object_name_index:
+            raise AlreadyInSceneError(object._name)
         self._object_memory.append(object)
+        self._object_name_index[object._name] = object
+        self._object_by_id[object._id] = object
         object._scenes.append(self)
 
     def remove_object(self, object: 'Object'):
@@ -288,6 +543,8 @@ class Scene:
         try:
             self._object_memory.remove(object)
             object._scenes.remove(self)
+            del self._object_name_index[object._name]
+            del self._object_by_id[object._id]
         except ValueError:
             raise IDNotFoundError(object._id)
 
@@ -298,10 +555,10 @@ class Scene:
         Parameters:
         - object_id (int): The identifier of the object which is to be retrieved.
         """
-        for obj in self._object_memory:
-            if obj._id == object_id:
-                return obj
-        raise IDNotFoundError(object_id)
+        try:
+            return self._object_by_id[object_id]
+        except KeyError:
+            raise IDNotFoundError(object_id)
     
     def add_light(self, light: 'Light'):
         """
@@ -310,9 +567,11 @@ class Scene:
         Parameters:
         - object (Light): Reference to the light to be added.
         """
-        if any(obj._name == light._name for obj in self._light_memory):
-            raise AlreadyInSceneError()
+        if light._name in self._light_name_index:
+            raise AlreadyInSceneError(light._name)
         self._light_memory.append(light)
+        self._light_name_index[light._name] = light
+        self._light_by_id[light._id] = light
         light._scenes.append(self)
 
     def remove_light(self, light: 'Light'):
@@ -325,6 +584,8 @@ class Scene:
         try:
             self._light_memory.remove(light)
             light._scenes.remove(self)
+            del self._light_name_index[light._name]
+            del self._light_by_id[light._id]
         except ValueError:
             raise IDNotFoundError(light._id)
 
@@ -335,10 +596,10 @@ class Scene:
         Parameters:
         - light_id (int): The identifier of the light which is to be retrieved.
         """
-        for obj in self._light_memory:
-            if obj._id == light_id:
-                return obj
-        raise IDNotFoundError(light_id)
+        try:
+            return self._light_by_id[light_id]
+        except KeyError:
+            raise IDNotFoundError(light_id)
     
     def set_active_camera(self, camera: 'Camera'):
         """
@@ -362,8 +623,9 @@ class Scene:
         Parameters:
         - new_name (str): New name assigned to the scene, must be unique among all scenes.
         """
-        if any(obj._name == new_name for obj in self._global_scene_memory):
-            raise DuplicateNameError()
+        if new_name in self._global_scene_memory:
+            raise DuplicateNameError(new_name)
+        self._global_scene_memory[new_name] = self._global_scene_memory.pop(self._name)
         self._name = new_name
         
     def render_scene(self, mode: str = 'face'):
@@ -373,13 +635,31 @@ class Scene:
         Parameters:
         - mode (str): Rendering mode, can be 'wire' or 'face'.
         """
-        if self._active_camera is None: raise NoActiveCamera(self._name)
-        distances = [(obj, obj.get_distance_to_camera(self._active_camera)) for obj in self._object_memory]
-        distances.sort(key=lambda x: x[1], reverse=True)
-        global_window.pointer.clear()
-        if global_window.screen.bgcolor() != self.ambient_light: global_window.screen.bgcolor(self.ambient_light)
-        for obj, distance in distances:
-            obj._render(global_window.pointer, self._active_camera, self.ambient_light, self._light_memory, mode)
+        camera = self._active_camera
+        if camera is None: raise NoActiveCamera(self._name)
+
+        # Shared by every object in the frame
+        view_matrix = camera.get_view_matrix()
+        camera_position = camera._position
+        camera_state = (camera._id, camera._version)
+        screen_scale = camera.get_screen_scale(global_window._width, global_window._height)
+        ambient_light = np.asarray(self.ambient_light, dtype=np.float64) / 255
+        lights = self._light_memory
+        light_arrays = (
+            np.array([light.position for light in lights], dtype=np.float64).reshape(-1, 3),
+            np.array([light.color for light in lights], dtype=np.float64).reshape(-1, 3) / 255,
+            np.array([light.intensity for light in lights], dtype=np.float64),
+        )
+
+        objects = self._object_memory
+        distances = np.fromiter((obj.get_squared_distance_to_camera(view_matrix, camera_position, camera_state) for obj in objects), dtype=np.float64, count=len(objects))
+        global_window._set_background_color(self.ambient_light)
+        polygons = []
+        lines = []
+        for index in np.argsort(-distances, kind='stable'):
+            objects[index]._render(polygons, lines, camera, camera_position, screen_scale, ambient_light, light_arrays, mode)
+        global_window._draw_polygons(polygons)
+        global_window._draw_lines(lines)
         global_window.screen.update()
         
 class Camera:
@@ -398,7 +678,7 @@ class Camera:
     - y_clamp (list): A list containing the minimum and maximum value for the rotation on the Y axis (i.e. [-90, 90]) - Defaults to None
     - z_clamp (list): A list containing the minimum and maximum value for the rotation on the Z axis (i.e. [-90, 90]) - Defaults to None
     """
-    _global_memory = []
+    _global_memory = {} # Keyed by name
     _next_memory_id = 1
 
     def __init__(self, name: str, position: list = None, rotation: list = None, fov: int = None, near_plane: float = None, far_plane: float = None, rotation_order : list = None, x_clamp: list = None, y_clamp: list = None, z_clamp: list = None):
@@ -419,12 +699,12 @@ class Camera:
         if y_clamp is None: z_clamp = None
         if z_clamp is None: z_clamp = None
 
-        if any(obj._name == name for obj in self._global_memory):
-            raise DuplicateNameError()
+        if name in self._global_memory:
+            raise DuplicateNameError(name)
         self._name = name
 
-        self._position = position
-        self._rotation = rotation
+        self._position = np.array(position, dtype=np.float32)
+        self._rotation = np.array(rotation, dtype=np.float32)
         self.fov = fov
         self.near_plane = near_plane
         self.far_plane = far_plane
@@ -432,10 +712,37 @@ class Camera:
         self.x_clamp = x_clamp
         self.y_clamp = y_clamp
         self.z_clamp = z_clamp
+        self._rotation_dirty = True # Rotation changed since cached matrices/vectors were last built
+        self._version = 0 # Bumped whenever the camera moves, rotates, or its view matrix is rebuilt
 
         self._id = self._next_memory_id
-        self._global_memory.append(self)
-        self._next_memory_id += 1
+        self._global_memory[name] = self
+        Camera._next_memory_id += 1
+
+    def _rebuild_cached_matrices(self):
+        """
+        Internal function to rebuild the cached view matrix and forward/up vectors from the camera's current rotation.
+        """
+        pitch, yaw, roll = [radians(angle) for angle in self._rotation]
+
+        sin_pitch = sin(pitch)
+        cos_pitch = cos(pitch)
+        sin_yaw = sin(-yaw)
+        cos_yaw = cos(-yaw)
+        sin_roll = sin(roll)
+        cos_roll = cos(roll)
+
+        self._cached_forward = [-sin_yaw * cos_pitch, sin_pitch, cos_pitch * cos_yaw]
+        self._cached_up = [
+            (cos_yaw * sin_roll) - (sin_yaw * sin_pitch * cos_roll),
+            cos_pitch * cos_roll,
+            (sin_yaw * sin_roll) + (cos_yaw * sin_pitch * cos_roll),
+        ]
+        self._cached_view_matrix = build_rotation_matrix([-angle for angle in self._rotation], self.rotation_order)
+        self._cached_view_matrix.flags.writeable = False # Handed out by reference every frame, never copied
+        self._cached_rotation_order = list(self.rotation_order)
+        self._rotation_dirty = False
+        self._version += 1
 
     def get_forward_vector(self):
         """
@@ -444,13 +751,8 @@ class Camera:
         Returns:
         forward_vector (list): 3-dimensional vector for relative forward direction.
         """
-        pitch, yaw, _ = [math.radians(angle) for angle in self._rotation]
-        
-        forward_x = -math.sin(-yaw) * math.cos(pitch)
-        forward_y = math.sin(pitch)
-        forward_z = math.cos(pitch) * math.cos(-yaw)
-        
-        return [forward_x, forward_y, forward_z]
+        if self._rotation_dirty: self._rebuild_cached_matrices()
+        return list(self._cached_forward)
     
     def get_up_vector(self):
         """
@@ -459,17 +761,34 @@ class Camera:
         Returns:
         up_vector (list): 3-dimensional vector for relative up direction.
         """
-        pitch, yaw, roll = [math.radians(angle) for angle in self._rotation]
-
-        cos_yaw = math.cos(-yaw)
-        sin_yaw = math.sin(-yaw)
+        if self._rotation_dirty: self._rebuild_cached_matrices()
+        return list(self._cached_up)
 
-        up_x = (cos_yaw * math.sin(roll)) - (sin_yaw * math.sin(pitch) * math.cos(roll))
-        up_y = math.cos(pitch) * math.cos(roll)
-        up_z = (sin_yaw * math.sin(roll)) + (cos_yaw * math.sin(pitch) * math.cos(roll))
+    def get_view_matrix(self):
+        """
+        Get the matrix which undoes the camera's rotation (applied in rotation_order), used to move vertices into the camera's space.
 
-        return [up_x, up_y, up_z]
+        Returns:
+        view_matrix (numpy.ndarray): 3x3 read-only rotation matrix, shared rather than copied.
+        """
+        if self._rotation_dirty or self._cached_rotation_order != self.rotation_order: self._rebuild_cached_matrices()
+        return self._cached_view_matrix
     
+    def get_screen_scale(self, window_width: int, window_height: int):
+        """
+        Get the factors which map camera-space x/z and y/z onto the screen for the camera's field of view.
+
+        Parameters:
+        - window_width (int): Width of the window being rendered to.
+        - window_height (int): Height of the window being rendered to.
+
+        Returns:
+        screen_scale (tuple): The x and y scale factors.
+        """
+        half_width = tan(radians(self.fov) / 2)
+        half_height = half_width * window_height / window_width
+        return (window_width / half_width, window_height / half_height)
+
     def get_product_vector(self, vector_1, vector_2):
         """
         Get the dot product of two 3-dimensional vectors.
@@ -492,21 +811,23 @@ class Camera:
         - y (float): The amount of degrees to set Y axis rotation to.
         - z (float): The amount of degrees to set Z axis rotation to.
         """
-        if x:
+        if x is not None:
             if self.x_clamp:
                 if x < self.x_clamp[0]: x = self.x_clamp[0]
                 elif x > self.x_clamp[1]: x = self.x_clamp[1] 
             self._rotation[0] = x 
-        if y:
+        if y is not None:
             if self.y_clamp:
                 if y < self.y_clamp[0]: y = self.y_clamp[0]
                 elif y > self.y_clamp[1]: y = self.y_clamp[1] 
             self._rotation[1] = y 
-        if z:
+        if z is not None:
             if self.z_clamp:
                 if z < self.z_clamp[0]: z = self.z_clamp[0]
                 elif z > self.z_clamp[1]: z = self.z_clamp[1] 
-            self._rotation[0] = z
+            self._rotation[2] = z
+        self._rotation_dirty = True
+        self._version += 1
 
     
     def rotate(self, x: float = None, y: float = None, z: float = None):
@@ -518,21 +839,23 @@ class Camera:
         - y (float): The amount of degrees to turn around Y axis by.
         - z (float): The amount of degrees to turn around Z axis by.
         """
-        if x:
+        if x is not None:
             if self.x_clamp:
                 if x + self._rotation[0] < self.x_clamp[0]: x = self.x_clamp[0] - self._rotation[0]
                 elif x + self._rotation[0] > self.x_clamp[1]: x = self.x_clamp[1] - self._rotation[0]     
             self._rotation[0] += x 
-        if y:
+        if y is not None:
             if self.y_clamp:
                 if y + self._rotation[1] < self.y_clamp[0]: y = self.y_clamp[0] - self._rotation[1]
                 elif y + self._rotation[1] > self.y_clamp[1]: y = self.y_clamp[1] - self._rotation[1]     
             self._rotation[1] += y 
-        if z:
+        if z is not None:
             if self.z_clamp:
                 if z + self._rotation[2] < self.z_clamp[0]: z = self.z_clamp[0] - self._rotation[2]
                 elif z + self._rotation[2] > self.z_clamp[1]: z = self.z_clamp[1] - self._rotation[2]     
             self._rotation[2] += z
+        self._rotation_dirty = True
+        self._version += 1
             
     def translate(self, x : float = None, y : float = None, z : float = None):
         """
@@ -543,9 +866,10 @@ class Camera:
         - y (float): The translation amount for the Y axis.
         - z (float): The translation amount for the Z axis.
         """
-        if x: self._position[0] += x
-        if y: self._position[1] += y
-        if z: self._position[2] += z
+        if x is not None: self._position[0] += x
+        if y is not None: self._position[1] += y
+        if z is not None: self._position[2] += z
+        self._version += 1
 
     def set_position(self, x : float = None, y : float = None, z : float = None):
         """
@@ -556,9 +880,10 @@ class Camera:
         - y (float): The position on the Y axis.
         - z (float): The position on the Z axis.
         """
-        if x: self._position[0] = x
-        if y: self._position[1] = y
-        if z: self._position[2] = z
+        if x is not None: self._position[0] = x
+        if y is not None: self._position[1] = y
+        if z is not None: self._position[2] = z
+        self._version += 1
         
     def add_to_scene(self, scene: Scene):
         """
@@ -586,28 +911,75 @@ class Camera:
         Parameters:
         - new_name (str): New name assigned to the camera, must be unique among all scenes.
         """
-        if any(obj._name == new_name for obj in self._global_memory):
-            raise DuplicateNameError()
+        if new_name in self._global_memory:
+            raise DuplicateNameError(new_name)
+        self._global_memory[new_name] = self._global_memory.pop(self._name)
         self._name = new_name
 
+class Mesh:
+    """
+    Geometry (vertices and faces) that can be shared between multiple objects. Objects only store their own transformations, and reference the mesh's arrays rather than copying them.
+
+    Parameters:
+    - vertex_array (list): A list of vertices that defines the shape of the mesh. Vertices are centered around their centroid.
+    - face_array (list): A list of indexes used to construct faces (starts at 1 by .obj convention), or the Fx3 faces array returned by load_obj_file. Faces with more than three vertices are fan triangulated.
+    """
+    def __init__(self, vertex_array: list, face_array: list):
+        if not (isinstance(face_array, np.ndarray) and face_array.shape[1:] == (3,)):
+            face_array = triangulate_face_array(face_array)
+
+        self._vertex_array = self._center_vertex_array(vertex_array, [0,0,0])
+        self._faces = np.asarray(face_array, dtype=np.int32) - 1 # Zero-based
+
+        first_vertices, second_vertices, third_vertices = self._vertex_array[self._faces.T]
+
+        # Unnormalized object space face normals, objects rotate and scale these instead of rebuilding them from their vertices
+        self._face_normals = np.cross(second_vertices - first_vertices, third_vertices - first_vertices)
+
+        # Object space face centroids, transformed along with the vertices to depth sort faces
+        self._face_centroids = (first_vertices + second_vertices + third_vertices) / np.float32(3)
+
+        for array in (self._vertex_array, self._faces, self._face_normals, self._face_centroids):
+            array.flags.writeable = False
+
+    def _center_vertex_array(self, vertex_array, new_centroid: list = None, current_centroid = None):
+        """
+        Adjusts a vertex array to make the centroid at the specified new centroid position, with an optional parameter to specify the current centroid to create offsets.
+
+        Parameters:
+        - vertex_array (numpy.ndarray): Nx3 array (or 2D list) of vertices.
+        - new_centroid (list): The x, y, z coordinates of the new centroid position.
+        - current_centroid (list): The x, y, z coordinates of the current centroid position - Defaults to calculated current centroid.
+
+        Returns:
+        - new_vertex_array (numpy.ndarray): Centered Nx3 float32 array of vertices with centroid at new_centroid
+        """
+        vertex_array = np.asarray(vertex_array, dtype=np.float64).reshape(-1, 3)
+        if len(vertex_array) == 0:
+            return vertex_array.astype(np.float32)
+
+        if current_centroid is None:
+            current_centroid = vertex_array.mean(axis=0)
+
+        return (vertex_array + (np.asarray(new_centroid, dtype=np.float64) - current_centroid)).astype(np.float32)
+    
 class Object:
     """
     Represents a renderable object that can be applied to multiple scenes, with various transformation properties.
 
     Parameters:
     - name (str): Name of the renderable object, must be unique in the global memory.
-    - vertex_array (list): A list of vertices that defines the shape of the object.
-    - face_array (list): A list of indexes used to construct faces to define the shape of the object (starts at 1 by .obj convention).
+    - mesh (Mesh): The geometry that defines the shape of the object, which can be shared with other objects.
     - position (list): A list of three floats or integers representing the object's position on the x, y, and z axis - Defaults to [0,0,0].
     - rotation (list): A list of three floats or integers representing the rotation transformation around the x, y, and z axis - Defaults to [0,0,0].
     - scale (float | int | list): A list of three floats or integers representing how much the object should be scaled, where 1 represents original size. A singular float or int represent uniform scaling. Defaults to [1,1,1].
     - material (Material): An instance of Material containing the lighting properties for the object - Defaults to default Material instance.
     - visible (bool): A boolean indicating whether the object is visible in the scene - Defaults to True.
     """
-    _global_memory = []
+    _global_memory = {} # Keyed by name
     _next_memory_id = 1
 
-    def __init__(self, name: str, vertex_array: list, face_array : list, position: list = None, rotation: list = None, scale: float | int | list = None, material: Material = None, visible: bool = None):
+    def __init__(self, name: str, mesh: 'Mesh', position: list = None, rotation: list = None, scale: float | int | list = None, material: Material = None, visible: bool = None):
         
         if position is None:
             position = [0, 0, 0]
@@ -620,137 +992,114 @@ class Object:
         if visible is None:
             visible = True
         
-        self._face_array = face_array
-
-        vertex_array = self._center_vertex_array(vertex_array, [0,0,0])
-        self._original_vertex_array = vertex_array
-        self._transformed_vertex_array = vertex_array
-        self._translated_vertex_array = vertex_array
-        self._camera_perspective_vertex_array = None # Only updated during render
-
-        if any(obj._name == name for obj in self._global_memory):
-            raise DuplicateNameError()
+        if name in self._global_memory:
+            raise DuplicateNameError(name)
         self._name = name
 
-        position[2] = 0 - position[2]
-        self._position = position
-        self._rotation = rotation
+        self._position = np.array([position[0], position[1], -position[2]], dtype=np.float32)
+        self._rotation = np.array(rotation, dtype=np.float32)
         if isinstance(scale, float) or isinstance(scale, int): scale = [scale, scale, scale]
-        self._scale = scale
+        self._scale = np.array(scale, dtype=np.float32)
 
         self.material = material
         self.visible = visible
 
         self._scenes = []
         self._id = self._next_memory_id
-        self._global_memory.append(self)
-        self._next_memory_id += 1
+        self._global_memory[name] = self
+        Object._next_memory_id += 1
         
-        self._update_transformed_vertices()
+        self._version = 0 # Bumped whenever transformations are applied
+        self.set_mesh(mesh)
 
-    def update_vertex_array(self, new_vertex_array: list, new_face_array: list = None):
+    def set_mesh(self, mesh: 'Mesh'):
         """
-        Update the vertex array (and optionally the face array). Object will be automatically repositioned, scaled, and rotated.
+        Set the mesh used by the object. Object will be automatically repositioned, scaled, and rotated.
 
         Parameters:
-        - new_vertex_array (list): The new vertex array for the object.
-        - new_face_array (list): The new face array for the object - Defaults to None.
-        """
-        if new_face_array: self._face_array = new_face_array
-        new_vertex_array = self._center_vertex_array(new_vertex_array, [0,0,0])
-        self._original_vertex_array = new_vertex_array
-        self._transformed_vertex_array = new_vertex_array
-        self._translated_vertex_array = new_vertex_array
-        self._camera_perspective_vertex_array = None
-        self._update_transformed_vertices()        
-        
-    def get_distance_to_camera(self, camera: Camera):
-        """
-        Get the distance from a camera to the closest vertex in the object.
+        - mesh (Mesh): The new geometry for the object.
+        """
+        self._mesh = mesh
+        self._original_vertex_array = mesh._vertex_array # Shared with every object using the mesh
+        self._faces = mesh._faces
+        self._original_face_normals = mesh._face_normals
+        self._face_normals = np.empty_like(mesh._face_normals) # World-space unit normals, updated with scale/rotation
+        self._original_face_centroids = mesh._face_centroids
+        self._transformed_face_centroids = np.empty_like(mesh._face_centroids)
+        self._translated_face_centroids = np.empty_like(mesh._face_centroids)
+        self._camera_perspective_vertex_array = np.empty_like(mesh._vertex_array) # Only updated during render
+        self._transform_dirty = True # Scale/rotation changed since the model matrix was last built
+        self._translation_dirty = True # Position changed since the translation was last updated
+        self._cached_camera_state = None # Camera (id, version) that the camera-space vertices were last built for
+        self._cached_squared_distance = None
+        self._cached_draw_key = None # Everything the last render's output depended on
+        self._cached_draw = [] # The (coords, fill) tuples the last render produced
+
+    def transform_to_camera(self, view_matrix: np.ndarray, camera_position: np.ndarray):
+        """
+        Transforms the mesh's vertices into the space of a camera, relative to its position. Stored until the next render.
 
         Parameters:
-        - camera (Camera): The camera object to measure distance from.
-        
-        Returns:
-        - distance (float): The shortest distance from the object to the camera.
+        - view_matrix (numpy.ndarray): 3x3 matrix which undoes the camera's rotation.
+        - camera_position (numpy.ndarray): The x, y, z coordinates of the camera.
         """
-        camera_position = camera._position
-        camera_rotation = camera._rotation
-        
-        self._camera_perspective_vertex_array = copy.deepcopy(self._translated_vertex_array)
-
-        for step in camera.rotation_order:
-            if step == 'x': self._rotate_x(-camera_rotation[0], self._camera_perspective_vertex_array, camera_position)
-            if step == 'y': self._rotate_y(-camera_rotation[1], self._camera_perspective_vertex_array, camera_position)
-            if step == 'z': self._rotate_z(-camera_rotation[2], self._camera_perspective_vertex_array, camera_position)
-            
-        distances = []    
-            
-        for vertex in self._camera_perspective_vertex_array:
-            x1, y1, z1 = camera_position
-            x2, y2, z2 = vertex
-            
-            dx = (x2 - x1) ** 2
-            dy = (y2 - y1) ** 2
-            dz = (z2 - z1) ** 2
+        self._update_transformed_vertices()
 
-            distances.append(math.sqrt(dx + dy + dz))
-            
-        distances.sort()
-        return distances[0]
+        # Model and view transforms fused into one affine transform, so vertices go from object space to camera space in a single matmul
+        camera_matrix = view_matrix @ self._model_matrix
+        camera_offset = view_matrix @ (self._translation - camera_position)
 
-    def _update_transformed_vertices(self):
-        """
-        Applies all transformations (excluding translation) to original vertex data.
-        """
-        self._transformed_vertex_array = copy.deepcopy(self._original_vertex_array)
-        self._transformed_vertex_array = [[x * self._scale[0], y * self._scale[1], z * self._scale[2]] for x, y, z in self._transformed_vertex_array]
-        self._rotate_x(self._rotation[0], self._transformed_vertex_array, [0,0,0])
-        self._rotate_y(self._rotation[1], self._transformed_vertex_array, [0,0,0])
-        self._rotate_z(self._rotation[2], self._transformed_vertex_array, [0,0,0])
-        self._update_translated_vertices()
+        # Hot path (runs per object per frame): written in place into the buffer allocated with the vertex array
+        np.matmul(self._original_vertex_array, camera_matrix.T, out=self._camera_perspective_vertex_array)
+        self._camera_perspective_vertex_array += camera_offset
 
-    def _update_translated_vertices(self):
+    def get_squared_distance_to_camera(self, view_matrix: np.ndarray, camera_position: np.ndarray, camera_state: tuple = None):
         """
-        Applies translations to transformed vertex data (world-space).
-        """
-        self._translated_vertex_array = copy.deepcopy(self._transformed_vertex_array)
-        for i in range(len(self._translated_vertex_array)):
-            vertex = self._translated_vertex_array[i]
-            self._translated_vertex_array[i] = [vertex[0]+self._position[0], vertex[1]+self._position[1], vertex[2]-self._position[2]]
-    
-    def _center_vertex_array(self, vertex_array, new_centroid: list = None, current_centroid = None):
-        """
-        Adjusts an object's vertex array to make the centroid at the specified new centroid position, with an optional parameter to specify the current centroid to create offsets.
+        Get the squared distance from a camera to the closest vertex in the object, transforming the object into the camera's space. Squared distances sort the same as distances, so no square root is taken.
 
         Parameters:
-        - vertex_array (list): 2D list of an object's vertices.
-        - new_centroid (list): The x, y, z coordinates of the new centroid position.
-        - current_centroid (list): The x, y, z coordinates of the current centroid position - Defaults to calculated current centroid.
-
+        - view_matrix (numpy.ndarray): 3x3 matrix which undoes the camera's rotation.
+        - camera_position (numpy.ndarray): The x, y, z coordinates of the camera.
+        - camera_state (tuple): The camera's (id, version). When neither the camera nor the object changed since the last call, the previous result is reused - Defaults to None (always recalculated).
+        
         Returns:
-        - new_vertex_array (list): Centered 2D list of an object's vertices with centroid at new_centroid
+        - squared_distance (float): The shortest squared distance from the object to the camera.
         """
-        num_vertices = len(vertex_array)
-        if num_vertices == 0:
-            return []
-
-        if current_centroid is None:
-            sum_x = sum_y = sum_z = 0
-            for vertex in vertex_array:
-                sum_x += vertex[0]
-                sum_y += vertex[1]
-                sum_z += vertex[2]
-
-            current_centroid = [sum_x / num_vertices, sum_y / num_vertices, sum_z / num_vertices]
-
-        dx = new_centroid[0] - current_centroid[0]
-        dy = new_centroid[1] - current_centroid[1]
-        dz = new_centroid[2] - current_centroid[2]
+        self._update_transformed_vertices() # May invalidate the cached camera state
+        if camera_state is None or camera_state != self._cached_camera_state:
+            self.transform_to_camera(view_matrix, camera_position)
+            camera_vertices = self._camera_perspective_vertex_array
+            self._cached_squared_distance = np.min(np.einsum('ij,ij->i', camera_vertices, camera_vertices))
+            self._cached_camera_state = camera_state
+        return self._cached_squared_distance
 
-        new_vertex_array = [[vertex[0] + dx, vertex[1] + dy, vertex[2] + dz] for vertex in vertex_array]
+    def _update_transformed_vertices(self):
+        """
+        Applies pending transformations to the model matrix, translation, and world-space face normals and centroids. Vertices themselves are transformed straight into a camera's space by transform_to_camera. Transform setters only flag what changed, so any number of calls between renders costs a single update, and nothing is done when the object hasn't changed. Scale and rotation are only reapplied when flagged as changed, otherwise just the translation is.
+        """
+        if not (self._transform_dirty or self._translation_dirty):
+            return
 
-        return new_vertex_array
+        # Runs once per changed object per frame, only on per-face data: both steps write into preallocated buffers, nothing is copied
+        if self._transform_dirty:
+            rotation_matrix = build_rotation_matrix(self._rotation)
+            self._model_matrix = rotation_matrix * self._scale # Combined scale and rotation
+            np.matmul(self._original_face_centroids, self._model_matrix.T, out=self._transformed_face_centroids)
+
+            # Each normal axis is scaled by the other two axes (the cofactor of the scale), keeping normals perpendicular under non-uniform scaling
+            scale_x, scale_y, scale_z = self._scale
+            normals = self._face_normals
+            np.matmul(self._original_face_normals, (rotation_matrix * (scale_y * scale_z, scale_x * scale_z, scale_x * scale_y)).T, out=normals)
+            lengths = np.sqrt(np.einsum('ij,ij->i', normals, normals))[:, None]
+            lengths[lengths < 1e-6] = np.inf # Degenerate faces get a zero normal
+            normals /= lengths
+
+            self._transform_dirty = False
+        self._translation = np.array((self._position[0], self._position[1], -self._position[2]), dtype=np.float32)
+        np.add(self._transformed_face_centroids, self._translation, out=self._translated_face_centroids)
+        self._translation_dirty = False
+        self._cached_camera_state = None # Camera-space vertices are now stale
+        self._version += 1
     
     def set_rotation(self, x: float = None, y: float = None, z: float = None):
         """
@@ -761,10 +1110,10 @@ class Object:
         - y (float): The amount of degrees to set Y axis rotation to.
         - z (float): The amount of degrees to set Z axis rotation to.
         """
-        if x: self._rotation[0] = x 
-        if y: self._rotation[1] = y
-        if z: self._rotation[2] = z
-        self._update_transformed_vertices()
+        if x is not None: self._rotation[0] = x 
+        if y is not None: self._rotation[1] = y
+        if z is not None: self._rotation[2] = z
+        self._transform_dirty = True
 
     
     def rotate(self, x: float = None, y: float = None, z: float = None):
@@ -776,86 +1125,11 @@ class Object:
         - y (float): The amount of degrees to turn around Y axis by.
         - z (float): The amount of degrees to turn around Z axis by.
         """
-        if x: self._rotation[0] += x 
-        if y: self._rotation[1] += y
-        if z: self._rotation[2] += z
-        self._update_transformed_vertices()
+        if x is not None: self._rotation[0] += x 
+        if y is not None: self._rotation[1] += y
+        if z is not None: self._rotation[2] += z
+        self._transform_dirty = True
     
-    def _rotate_x(self, angle: float, vertex_array: list, pivot: list):
-        """
-        Rotate vertex array by a certain amount of degrees on the X axis around a pivot.
-
-        Parameters:
-        - angle (float): The amount of degrees to turn by.
-        - vertex_array (list): The vertices to rotate.
-        - pivot (list): The point to turn around.
-        """
-        angle = math.radians(angle)
-        sinTheata = math.sin(angle)
-        cosTheata = math.cos(angle)
-        
-        py, pz = pivot[1], pivot[2]
-        
-        for a in range(len(vertex_array)):
-            y = vertex_array[a][1] - py
-            z = vertex_array[a][2] - pz
-            
-            new_y = y * cosTheata + z * sinTheata
-            new_z = z * cosTheata - y * sinTheata
-            
-            vertex_array[a][1] = new_y + py
-            vertex_array[a][2] = new_z + pz
-
-    def _rotate_y(self, angle: float, vertex_array: list, pivot: list):
-        """
-        Rotate vertex array by a certain amount of degrees on the Y axis around a pivot.
-
-        Parameters:
-        - angle (float): The amount of degrees to turn by.
-        - vertex_array (list): The vertices to rotate.
-        - pivot (list): The point to turn around.
-        """
-        angle = math.radians(angle)
-        sinTheata = math.sin(angle)
-        cosTheata = math.cos(angle)
-        
-        px, pz = pivot[0], pivot[2]
-
-        for a in range(len(vertex_array)):
-            x = vertex_array[a][0] - px
-            z = vertex_array[a][2] - pz
-            
-            new_x = x * cosTheata + z * sinTheata
-            new_z = z * cosTheata - x * sinTheata
-            
-            vertex_array[a][0] = new_x + px
-            vertex_array[a][2] = new_z + pz
-
-    def _rotate_z(self, angle: float, vertex_array: list, pivot: list):
-        """
-        Rotate vertex array by a certain amount of degrees on the Z axis around a pivot.
-
-        Parameters:
-        - angle (float): The amount of degrees to turn by.
-        - vertex_array (list): The vertices to rotate.
-        - pivot (list): The point to turn around.
-        """
-        angle = math.radians(angle)
-        sinTheata = math.sin(angle)
-        cosTheata = math.cos(angle)
-        
-        px, py = pivot[0], pivot[1]
-        
-        for a in range(len(vertex_array)):
-            x = vertex_array[a][0] - px
-            y = vertex_array[a][1] - py
-            
-            new_x = x * cosTheata + y * sinTheata
-            new_y = y * cosTheata - x * sinTheata
-            
-            vertex_array[a][0] = new_x + px
-            vertex_array[a][1] = new_y + py
-
     def set_scale(self, x_axis_multiplier : float = None, y_axis_multiplier : float = None, z_axis_multiplier : float = None, uniform = False):
         """
         Sets the object scale on all 3 axis, with the option of uniform rescaling (takes only x_axis_mulitplier).
@@ -867,8 +1141,10 @@ class Object:
         - uniform (bool): When True, x_axis_multiplier becomes multiplier for all axis.
         """ 
         if uniform: z_axis_multiplier = y_axis_multiplier = x_axis_multiplier
-        self._scale = [x_axis_multiplier, y_axis_multiplier, z_axis_multiplier]
-        self._update_transformed_vertices()
+        if x_axis_multiplier is not None: self._scale[0] = x_axis_multiplier
+        if y_axis_multiplier is not None: self._scale[1] = y_axis_multiplier
+        if z_axis_multiplier is not None: self._scale[2] = z_axis_multiplier
+        self._transform_dirty = True
 
 
     def scale(self, x_axis_multiplier : float = None, y_axis_multiplier : float = None, z_axis_multiplier : float = None, uniform = False):
@@ -882,8 +1158,10 @@ class Object:
         - uniform (bool): When True, x_axis_multiplier becomes multiplier for all axis.
         """
         if uniform: z_axis_multiplier = y_axis_multiplier = x_axis_multiplier
-        self._scale = [self._scale[0] * x_axis_multiplier, self._scale[1] * y_axis_multiplier, self._scale[2] * z_axis_multiplier]
-        self._update_transformed_vertices()
+        if x_axis_multiplier is not None: self._scale[0] *= x_axis_multiplier
+        if y_axis_multiplier is not None: self._scale[1] *= y_axis_multiplier
+        if z_axis_multiplier is not None: self._scale[2] *= z_axis_multiplier
+        self._transform_dirty = True
 
     def translate(self, x : float = None, y : float = None, z : float = None):
         """
@@ -894,10 +1172,10 @@ class Object:
         - y (float): The translation amount for the Y axis.
         - z (float): The translation amount for the Z axis.
         """
-        if x: self._position[0] += x
-        if y: self._position[1] += y
-        if z: self._position[2] += z
-        self._update_transformed_vertices()
+        if x is not None: self._position[0] += x
+        if y is not None: self._position[1] += y
+        if z is not None: self._position[2] += z
+        self._translation_dirty = True
 
     def set_position(self, x : float = None, y : float = None, z : float = None):
         """
@@ -908,10 +1186,10 @@ class Object:
         - y (float): The position on the Y axis.
         - z (float): The position on the Z axis.
         """
-        if x: self._position[0] = x
-        if y: self._position[1] = y
-        if z: self._position[2] = z
-        self._update_transformed_vertices()
+        if x is not None: self._position[0] = x
+        if y is not None: self._position[1] = y
+        if z is not None: self._position[2] = z
+        self._translation_dirty = True
         
     def add_to_scene(self, scene: Scene):
         """
@@ -941,159 +1219,96 @@ class Object:
         Parameters:
         - new_name (str): New name assigned to the object, must be unique among all scenes.
         """
-        if any(obj._name == new_name for obj in self._global_memory):
-            raise DuplicateNameError()
+        if new_name in self._global_memory:
+            raise DuplicateNameError(new_name)
+        self._global_memory[new_name] = self._global_memory.pop(self._name)
+        for scene in self._scenes:
+            scene._object_name_index[new_name] = scene._object_name_index.pop(self._name)
         self._name = new_name
 
-    def _render(self, pointer: turtle.Turtle, camera: Camera, ambient_light: tuple, lights, mode: str = "face"):
+    def _render(self, polygons: list, lines: list, camera: Camera, camera_position: np.ndarray, screen_scale: tuple, ambient_light: np.ndarray, light_arrays: tuple, mode: str = "face"):
         """
-        Renders object from the perspective of a camera with lighting data.
+        Renders object from the perspective of a camera with lighting data. Expects vertices to already be in the camera's space (see transform_to_camera).
 
         Parameters:
-        - pointer (turtle.Turtle): Turtle pointer used to render object.
+        - polygons (list): Frame-wide list of (coords, fill) tuples which filled faces are appended to, drawn by the window once all objects are rendered.
+        - lines (list): Frame-wide list of (coords, fill) tuples which wireframe outlines are appended to, drawn like polygons.
         - camera (Camera): Camera instance to use for rendering.
-        - ambient_light (tuple): An RGB tuple containing the ambient light colour.
-        - lights (list): A list of Light objects used to light the object.
+        - camera_position (numpy.ndarray): The x, y, z coordinates of the camera, computed once per frame.
+        - screen_scale (tuple): The camera's x and y screen scale factors (see Camera.get_screen_scale), computed once per frame.
+        - ambient_light (numpy.ndarray): The ambient light colour scaled to 0.0 - 1.0, computed once per frame.
+        - light_arrays (tuple): The positions (Lx3), colours scaled to 0.0 - 1.0 (Lx3), and intensities (L) of the lights used to light the object, packed into arrays once per frame.
         - mode (str): Rendering mode, can be 'wire' or 'face'.
         """
         if not self.visible:
             return
 
-        camera_position = camera._position
-        camera_rotation = camera._rotation
-        fov = camera.fov
+        if mode == 'wire': output = lines
+        elif mode == 'face': output = polygons
+        else: raise Turtle3DError("Invalid rendering mode. Choose from 'wire', 'face'.")
+
+        # When nothing the output depends on changed since the last render, the previous frame's polygons/lines are reused as they are
+        material = self.material
+        draw_key = (
+            self._version, camera._id, camera._version, mode, screen_scale, camera.near_plane, camera.far_plane, ambient_light.tobytes(),
+            material.ambient_color.tobytes(), material.diffuse_color.tobytes(), material.specular_color.tobytes(), material.specular_coefficient,
+            tuple(array.tobytes() for array in light_arrays),
+        )
+        if draw_key == self._cached_draw_key:
+            output.extend(self._cached_draw)
+            return
+        first_item = len(output)
+
         near_plane = camera.near_plane
         far_plane = camera.far_plane
 
-        window_width = turtle.window_width()
-        window_height = turtle.window_height()
-        aspect_ratio = window_width / window_height
-
-        def precompute_normals():
-            self._face_normals = []
-            for face in self._face_array:
-                face_vertices = [self._translated_vertex_array[i - 1] for i in face]
-                normal = calculate_normal(face_vertices[:3]) 
-                self._face_normals.append(normal)
-
-        def calculate_normal(face_vertices):
-            u = [face_vertices[1][i] - face_vertices[0][i] for i in range(3)]
-            v = [face_vertices[2][i] - face_vertices[0][i] for i in range(3)]
-            normal = [
-                u[1]*v[2] - u[2]*v[1],
-                u[2]*v[0] - u[0]*v[2],
-                u[0]*v[1] - u[1]*v[0],
-            ]
-            return normalize_vector(normal)
-        
-        def normalize_vector(vector):
-            norm = (vector[0] ** 2 + vector[1] ** 2 + vector[2] ** 2) ** 0.5
-            if norm < 1e-6:
-                return [0, 0, 0]
-            return [v / norm for v in vector]
-
-        def perspective_transform(vert):
-            fov_rad = math.radians(fov)
-            half_width = math.tan(fov_rad / 2)
-            half_height = half_width / aspect_ratio
-
-            x_offset = vert[0] - camera_position[0]
-            y_offset = vert[1] - camera_position[1]
-            z_offset = vert[2] - camera_position[2]
-
-            if z_offset <= near_plane:
-                return None
-            elif z_offset > far_plane:
-                return None
-
-            x_proj = x_offset / (z_offset * half_width)
-            y_proj = y_offset / (z_offset * half_height)
+        faces = self._faces
 
-            x_ndc = x_proj * 2 - 1
-            y_ndc = 1 - y_proj * 2
+        def project_vertices(vertex_array):
+            # Projects every vertex in one pass, returning Nx2 screen coordinates and a mask of the vertices between the clipping planes
+            z_offset = vertex_array[:, 2]
+            valid = (z_offset > near_plane) & (z_offset <= far_plane)
 
-            x_screen = (x_ndc + 1) / 2 * window_width
-            y_screen = (1 - y_ndc) / 2 * window_height
+            screen = np.empty((len(vertex_array), 2), dtype=vertex_array.dtype)
+            with np.errstate(divide='ignore', invalid='ignore'): # Vertices on the camera plane are masked out by valid
+                np.divide(vertex_array[:, :2], z_offset[:, None], out=screen)
+            screen *= screen_scale
 
-            return [x_screen, y_screen]
+            return screen, valid
 
-        def compute_lighting(face_vertices, normal, lights, camera_position, material):
-            color = [material.ambient_color[i] * ambient_light[i] / 255 for i in range(3)]
-
-            normalized_normal = normalize_vector(normal)
-
-            for light in lights:
-                light_dir = [light.position[i] - face_vertices[0][i] for i in range(3)]
-                light_distance = math.sqrt(sum([d ** 2 for d in light_dir]))
-                normalized_light_dir = normalize_vector(light_dir)
-
-                dot_product = max(sum(n * l for n, l in zip(normalized_normal, normalized_light_dir)), 0)
-                diffuse_intensity = dot_product * light.intensity
-                diffuse = [material.diffuse_color[i] * diffuse_intensity * light.color[i] / 255 for i in range(3)]
-                
-                reflect_dir = [2 * normalized_normal[i] * dot_product - normalized_light_dir[i] for i in range(3)]
-                normalized_reflect_dir = normalize_vector(reflect_dir)
-                view_dir = normalize_vector([camera_position[i] - face_vertices[0][i] for i in range(3)])
-                spec_angle = max(sum(r * v for r, v in zip(normalized_reflect_dir, view_dir)), 0)
-                spec_intensity = (spec_angle ** material.specular_coefficient) / (light_distance + 1)
-                specular = [material.specular_color[i] * spec_intensity * light.color[i] / 255 for i in range(3)]
-
-                color = [min(255, color[i] + diffuse[i] + specular[i]) for i in range(3)]
-
-            return color
+        def compute_lighting(anchors, normals):
+            # Lights every face at once, anchors and normals are Fx3 world-space arrays. Light arrays are shared by the frame, so the only per-object setup is the lit ambient colour
+            return _light_faces(
+                anchors, normals, camera_position, *light_arrays, material.ambient_color * ambient_light,
+                material.diffuse_color, material.specular_color, float(material.specular_coefficient),
+            )
         
-        def draw_filled_polygon(vertices, color):
-            color = [int(c) for c in color]
-            pointer.fillcolor(color)
-            pointer.penup() 
-            pointer.goto(vertices[0][0], vertices[0][1])
-            pointer.begin_fill()
-            for vertex in vertices[1:]:
-                pointer.goto(vertex[0], vertex[1])
-            pointer.goto(vertices[0][0], vertices[0][1])
-            pointer.end_fill()
-
         def draw_wireframe(vertex_array):
-            pointer.pensize(1)
-            pointer.color(self.material.ambient_color)
-            for face in self._face_array:
-                projected_face = []
-                for vertex_index in face:
-                    vertex = perspective_transform(vertex_array[vertex_index - 1])
-                    if vertex is not None:
-                        projected_face.append(vertex)
-                if len(projected_face) < 3:
-                    continue
-                pointer.penup()
-                pointer.goto(projected_face[0][0], projected_face[0][1])
-                pointer.pendown()
-                for vertex in projected_face[1:]:
-                    pointer.goto(vertex[0], vertex[1])
-                pointer.goto(projected_face[0][0], projected_face[0][1])
+            fill = "#%02x%02x%02x" % tuple(self.material.ambient_color.tolist())
+            screen, valid = project_vertices(vertex_array)
+            screen[:, 1] *= -1 # Canvas Y axis points down
+            triangles = screen[faces[valid[faces].all(axis=1)]] # Only triangles entirely between the clipping planes are drawn
+            outlines = np.concatenate((triangles, triangles[:, :1]), axis=1).reshape(-1, 8).tolist() # Closed outlines
+            lines.extend((coords, fill) for coords in outlines)
 
         def draw_faces(vertex_array):
-            precompute_normals()
+            screen, valid = project_vertices(vertex_array)
+            screen[:, 1] *= -1 # Canvas Y axis points down
+
+            # Depth of each face's centroid along the camera's view axis. The camera position would only offset every depth equally, so it is left out
+            z_centroids = self._translated_face_centroids @ camera.get_view_matrix()[2]
+            sorted_faces = np.argsort(-z_centroids, kind='stable') # Furthest first
+            sorted_faces = sorted_faces[valid[faces[sorted_faces]].all(axis=1)] # Only triangles entirely between the clipping planes are drawn
+
+            anchors = self._original_vertex_array[faces[sorted_faces, 0]] @ self._model_matrix.T + self._translation # World-space, only for the drawn faces
+            colors = compute_lighting(anchors, self._face_normals[sorted_faces]).astype(np.uint8).tolist() # Truncated to whole channels in one cast
+            coords = screen[faces[sorted_faces]].reshape(-1, 6).tolist()
+            polygons.extend((face_coords, "#%02x%02x%02x" % tuple(color)) for face_coords, color in zip(coords, colors)) # Tk colour strings, passed straight to the canvas
             
-            sorted_faces = sorted(enumerate(self._face_array), key=lambda item: -numpy.mean([vertex_array[i - 1][2] + camera_position[2] for i in item[1]]))
-            for index, face in sorted_faces:
-                face_vertices = [vertex_array[i - 1] for i in face]
-                projected_vertices = [perspective_transform(vertex) for vertex in face_vertices]
-                projected_vertices = [v for v in projected_vertices if v is not None]
-                if len(projected_vertices) < 3: continue
-                normal = self._face_normals[index]
-                color = compute_lighting(face_vertices, normal, lights, camera_position, self.material)
-                draw_filled_polygon(projected_vertices, color)
-            
-        self._camera_perspective_vertex_array = copy.deepcopy(self._translated_vertex_array)
-
-        for step in camera.rotation_order:
-            if step == 'x': self._rotate_x(-camera_rotation[0], self._camera_perspective_vertex_array, camera_position)
-            if step == 'y': self._rotate_y(-camera_rotation[1], self._camera_perspective_vertex_array, camera_position)
-            if step == 'z': self._rotate_z(-camera_rotation[2], self._camera_perspective_vertex_array, camera_position)
-
         if mode == 'wire':
             draw_wireframe(self._camera_perspective_vertex_array)
-        elif mode == 'face':
-            draw_faces(self._camera_perspective_vertex_array)
         else:
-            raise Turtle3DError("Invalid rendering mode. Choose from 'wire', 'face'.")
\ No newline at end of file
+            draw_faces(self._camera_perspective_vertex_array)
+
+        self._cached_draw = output[first_item:]
+        self._cached_draw_key = draw_key
\ No newline at end of file
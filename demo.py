@@ -37,11 +37,11 @@ def setup_scene():
 def load_objects(scene, material):
     """Load the 3D objects and add them to the scene."""
     # Load an OBJ file
-    vertices, faces = Turtle3D.load_obj_file('teapot.obj')
+    mesh = Turtle3D.Mesh(*Turtle3D.load_obj_file('teapot.obj'))
 
-    # Create multiple objects with the same model but different positions
+    # Create multiple objects sharing the same mesh but with different positions
     objects = [
-        Turtle3D.Object(f"Teapot_{i}", vertices, faces, material=material, scale=0.075, position=[i*25, 0, 0])
+        Turtle3D.Object(f"Teapot_{i}", mesh, material=material, scale=0.075, position=[i*25, 0, 0])
         for i in range(4)
     ]
     